@@ -2,50 +2,127 @@
 """Cardano SPO CLI main module."""
 
 import click
+import functools
+import os
 import sys
-import json
 from pathlib import Path
 from colorama import Fore, Style, init
 
-# Initialize colorama
-init()
+# Colors are only used on a terminal; NO_COLOR (https://no-color.org) disables them
+USE_COLOR = sys.stdout.isatty() and "NO_COLOR" not in os.environ
 
+# Resolved once; wallets live under ~/.CSPO_{TICKER}/
+HOME = Path.home()
 
-def print_banner():
-    """Print welcome banner"""
-    banner = f"""
-{Fore.CYAN}╔══════════════════════════════════════════════════════════════╗
+PURPOSES = ("pledge", "rewards")
+GENERATE_PURPOSES = PURPOSES + ("all",)
+NETWORKS = ("mainnet", "testnet", "preview", "preprod")
+
+# Generated files flagged as SENSITIVE in the listing
+SENSITIVE_SUFFIXES = (".mnemonic.txt", ".staking_skey", ".skey")
+
+
+class FrozenChoice(click.Choice):
+    """click.Choice with a frozenset lookup for exact matches"""
+
+    def __init__(self, choices, case_sensitive: bool = True):
+        super().__init__(choices, case_sensitive)
+        self.lookup = frozenset(choices)
+
+    def convert(self, value, param, ctx):
+        if value in self.lookup:
+            return value
+        # Fall back to Click for normalization and error reporting
+        return super().convert(value, param, ctx)
+
+
+# Shared validators, built once at import
+PURPOSE_CHOICE = FrozenChoice(PURPOSES)
+GENERATE_PURPOSE_CHOICE = FrozenChoice(GENERATE_PURPOSES)
+NETWORK_CHOICE = FrozenChoice(NETWORKS)
+
+
+# Color codes and status prefixes, built once for every message
+GREEN = Fore.GREEN
+RED = Fore.RED
+YELLOW = Fore.YELLOW
+CYAN = Fore.CYAN
+BLUE = Fore.BLUE
+RESET = Style.RESET_ALL
+OK = f"{GREEN}✅"
+ERR = f"{RED}❌"
+CANCELLED = f"{RED}Operation cancelled{RESET}"
+
+BANNER = f"""
+{CYAN}╔══════════════════════════════════════════════════════════════╗
 ║                    Cardano SPO CLI v1.0.0                        ║
 ║              Professional Stake Pool Operator Tool                ║
-╚══════════════════════════════════════════════════════════════╝{Style.RESET_ALL}
+╚══════════════════════════════════════════════════════════════╝{RESET}
 """
-    click.echo(banner)
 
-
-def print_security_warning():
-    """Print security warning"""
-    warning = f"""
-{Fore.RED}SECURITY WARNING:{Style.RESET_ALL}
+SECURITY_WARNING = f"""
+{RED}SECURITY WARNING:{RESET}
 • This tool generates real cryptographic keys
 • Store recovery phrases securely
 • Never share private keys
 • Create encrypted backups
 """
-    click.echo(warning)
-
 
-def print_next_steps(ticker: str, purpose: str, wallet_dir: Path):
-    """Print next steps for the user"""
-    steps = f"""
-{Fore.GREEN}Next Steps:{Style.RESET_ALL}
+NEXT_STEPS_TEMPLATE = f"""
+{GREEN}Next Steps:{RESET}
 1. Import the recovery phrase into a compatible Cardano wallet
 2. Transfer funds to the base address for pledge
 3. Keep the staking keys secure
 4. Monitor your stake pool performance
 
-{Fore.YELLOW}Files generated in: {wallet_dir}{Style.RESET_ALL}
+{YELLOW}Files generated in: {{wallet_dir}}{RESET}
 """
-    click.echo(steps)
+
+
+@functools.lru_cache(maxsize=None)
+def init_color():
+    """Initialize colorama once, right before a command prints colors"""
+    if USE_COLOR:
+        init()
+
+
+def print_banner():
+    """Print welcome banner"""
+    click.echo(BANNER)
+
+
+def print_security_warning():
+    """Print security warning"""
+    click.echo(SECURITY_WARNING)
+
+
+def print_next_steps(ticker: str, purpose: str, wallet_dir: Path):
+    """Print next steps for the user"""
+    click.echo(NEXT_STEPS_TEMPLATE.format(wallet_dir=wallet_dir))
+
+
+def emit_json(obj, pretty: bool = False):
+    """Write obj as JSON on stdout: compact by default, indented if pretty"""
+    import json
+
+    if pretty:
+        json.dump(obj, sys.stdout, indent=2)
+    else:
+        json.dump(obj, sys.stdout, separators=(",", ":"))
+    sys.stdout.write("\n")
+
+
+def check_or_confirm(wallet_dir: Path, label: str, force: bool, quiet: bool):
+    """Create the wallet directory, asking before regenerating an existing one"""
+    try:
+        wallet_dir.mkdir(parents=True)
+    except FileExistsError:
+        if force or quiet:
+            return
+        click.echo(f"{YELLOW}Wallet {label} already exists{RESET}")
+        if not click.confirm("Do you want to regenerate it?", default=False):
+            click.echo(CANCELLED)
+            sys.exit(0)
 
 
 @click.group()
@@ -78,14 +155,14 @@ def cli():
     "--purpose",
     "-p",
     required=True,
-    type=click.Choice(["pledge", "rewards"]),
-    help="Wallet purpose: pledge or rewards",
+    type=GENERATE_PURPOSE_CHOICE,
+    help="Wallet purpose: pledge, rewards or all (both)",
 )
 @click.option(
     "--network",
     "-n",
     default="mainnet",
-    type=click.Choice(["mainnet", "testnet", "preview", "preprod"]),
+    type=NETWORK_CHOICE,
     help="Cardano network (default: mainnet)",
 )
 @click.option(
@@ -94,6 +171,13 @@ def cli():
     is_flag=True,
     help="Force regeneration of existing wallet",
 )
+@click.option(
+    "--yes",
+    "-y",
+    is_flag=True,
+    envvar="CSPOCLI_ASSUME_YES",
+    help="Answer yes to all prompts (env: CSPOCLI_ASSUME_YES)",
+)
 @click.option("--no-banner", is_flag=True, help="Skip welcome banner")
 @click.option(
     "--quiet",
@@ -101,6 +185,11 @@ def cli():
     is_flag=True,
     help="Quiet mode - JSON output only",
 )
+@click.option(
+    "--pretty",
+    is_flag=True,
+    help="Indent the JSON output of quiet mode",
+)
 @click.option(
     "--simple",
     "-s",
@@ -112,14 +201,16 @@ def generate(
     purpose: str,
     network: str,
     force: bool,
+    yes: bool,
     no_banner: bool,
     quiet: bool,
+    pretty: bool,
     simple: bool,
 ):
     """
     Generate a secure Cardano wallet for stake pool operations
 
-    Creates wallet files for pledge or rewards purposes:
+    Creates wallet files for pledge or rewards purposes (or both with "all"):
     • base_addr - Address for pledge funds
     • reward_addr - Address for staking rewards
     • staking_skey - Private staking key (SENSITIVE)
@@ -132,9 +223,18 @@ def generate(
     Examples:
         cspocli generate --ticker MYPOOL --purpose pledge
         cspocli generate -t ADA -p rewards --simple
+        cspocli generate --ticker MYPOOL --purpose all
         cspocli generate --ticker CARDANO --purpose pledge --quiet
+        cspocli generate --ticker CARDANO --purpose pledge --quiet --pretty
+        cspocli generate --ticker MYPOOL --purpose all --yes
     """
 
+    if quiet:
+        # Machine-readable mode: strip ANSI codes from everything echoed
+        click.get_current_context().color = False
+    else:
+        init_color()
+
     if not quiet and not no_banner:
         print_banner()
 
@@ -142,95 +242,104 @@ def generate(
         print_security_warning()
 
         # Ask for confirmation
-        if not click.confirm("Do you want to continue?", default=True):
-            click.echo(f"{Fore.RED}Operation cancelled{Style.RESET_ALL}")
+        if not yes and not click.confirm("Do you want to continue?", default=True):
+            click.echo(CANCELLED)
             sys.exit(0)
 
     try:
-        # Check if wallet already exists
-        home_dir = Path.home() / f".CSPO_{ticker.upper()}"
-        wallet_dir = home_dir / purpose
-
-        if wallet_dir.exists() and not force:
-            if not quiet:
-                click.echo(
-                    f"{Fore.YELLOW}Wallet {ticker}-{purpose} already exists{Style.RESET_ALL}"
-                )
-                if not click.confirm("Do you want to regenerate it?", default=False):
-                    click.echo(f"{Fore.RED}Operation cancelled{Style.RESET_ALL}")
-                    sys.exit(0)
+        # Check if wallets already exist
+        ticker_up = ticker.upper()
+        home_dir = HOME / f".CSPO_{ticker_up}"
+        purposes = PURPOSES if purpose == "all" else (purpose,)
+
+        for purpose_item in purposes:
+            check_or_confirm(
+                home_dir / purpose_item,
+                f"{ticker}-{purpose_item}",
+                force or yes,
+                quiet,
+            )
 
-        # Generate wallet
+        # Generate wallets (one root key derivation for all purposes)
         if not quiet:
-            click.echo(
-                f"{Fore.CYAN}Generating {ticker}-{purpose} wallet...{Style.RESET_ALL}"
-            )
+            labels = ", ".join(f"{ticker}-{p}" for p in purposes)
+            noun = "wallets" if len(purposes) > 1 else "wallet"
+            click.echo(f"{CYAN}Generating {labels} {noun}...{RESET}")
 
         if simple:
             # Use simplified version
-            from cardano_spo_cli.tools.wallet_simple import generate_wallet_simple
+            from cardano_spo_cli.tools.wallet_simple import generate_wallets_simple
 
-            wallet_data = generate_wallet_simple(ticker, purpose, network)
+            all_wallet_data = generate_wallets_simple(ticker, purposes, network)
         else:
             # Use real Cardano tools by default
             try:
-                from cardano_spo_cli.tools.wallet import generate_wallet_real
+                from cardano_spo_cli.tools.wallet import generate_wallets_real
 
-                wallet_data = generate_wallet_real(ticker, purpose, network)
+                all_wallet_data = generate_wallets_real(
+                    ticker, purposes, network, force
+                )
             except click.ClickException as e:
                 if "Real Cardano tools not available" in str(e):
                     click.echo(
-                        f"{Fore.YELLOW}Real tools not available. Switching to simplified mode...{Style.RESET_ALL}"
+                        f"{YELLOW}Real tools not available. Switching to simplified mode...{RESET}"
                     )
                     from cardano_spo_cli.tools.wallet_simple import (
-                        generate_wallet_simple,
+                        generate_wallets_simple,
                     )
 
-                    wallet_data = generate_wallet_simple(ticker, purpose, network)
+                    all_wallet_data = generate_wallets_simple(ticker, purposes, network)
                 else:
                     raise e
 
-        # Display wallet information
-        if not quiet:
-            click.echo(
-                f"\n{Fore.GREEN}Files generated in: {wallet_dir}{Style.RESET_ALL}"
-            )
+        results = []
+        for purpose_item in purposes:
+            wallet_dir = home_dir / purpose_item
+            wallet_data = all_wallet_data[purpose_item]
 
-            # List generated files
-            files = list(wallet_dir.glob(f"{ticker}-{purpose}.*"))
-            for file in files:
-                if file.name.endswith(".mnemonic.txt") or file.name.endswith(
-                    ".staking_skey"
-                ):
-                    click.echo(f"  {Fore.RED}{file.name} (SENSITIVE){Style.RESET_ALL}")
-                else:
-                    click.echo(f"  {Fore.CYAN}{file.name}{Style.RESET_ALL}")
+            # Files reported by the generator, no directory rescan needed
+            generated_files = sorted(Path(f) for f in wallet_data["files"])
 
-            # Display addresses
-            click.echo(f"\n{Fore.CYAN}Generated addresses:{Style.RESET_ALL}")
-            click.echo(f"  Base Address: {wallet_data['base_addr']}")
-            click.echo(f"  Reward Address: {wallet_data['reward_addr']}")
-
-            # Display next steps
-            print_next_steps(ticker, purpose, wallet_dir)
+            # Display wallet information
+            if not quiet:
+                lines = [f"\n{GREEN}Files generated in: {wallet_dir}{RESET}"]
+
+                # List generated files
+                for file in generated_files:
+                    if file.name.endswith(SENSITIVE_SUFFIXES):
+                        lines.append(f"  {RED}{file.name} (SENSITIVE){RESET}")
+                    else:
+                        lines.append(f"  {CYAN}{file.name}{RESET}")
+
+                # Display addresses
+                lines.append(f"\n{CYAN}Generated addresses:{RESET}")
+                lines.append(f"  Base Address: {wallet_data['base_addr']}")
+                lines.append(f"  Reward Address: {wallet_data['reward_addr']}")
+                click.echo("\n".join(lines))
+
+                # Display next steps
+                print_next_steps(ticker, purpose_item, wallet_dir)
+            else:
+                results.append(
+                    {
+                        "ticker": ticker,
+                        "purpose": purpose_item,
+                        "wallet_dir": str(wallet_dir),
+                        "base_addr": wallet_data["base_addr"],
+                        "reward_addr": wallet_data["reward_addr"],
+                        "files": [str(f) for f in generated_files],
+                    }
+                )
 
-        # Return information in quiet mode
+        # Return information in quiet mode (a list when several purposes)
         if quiet:
-            result = {
-                "ticker": ticker,
-                "purpose": purpose,
-                "wallet_dir": str(wallet_dir),
-                "base_addr": wallet_data["base_addr"],
-                "reward_addr": wallet_data["reward_addr"],
-                "files": [str(f) for f in wallet_dir.glob(f"{ticker}-{purpose}.*")],
-            }
-            click.echo(json.dumps(result, indent=2))
+            emit_json(results if purpose == "all" else results[0], pretty)
 
     except click.ClickException as e:
-        click.echo(f"{Fore.RED}❌ Error: {e}{Style.RESET_ALL}")
+        click.echo(f"{ERR} Error: {e}{RESET}")
         sys.exit(1)
     except Exception as e:
-        click.echo(f"{Fore.RED}❌ Unexpected error: {e}{Style.RESET_ALL}")
+        click.echo(f"{ERR} Unexpected error: {e}{RESET}")
         sys.exit(1)
 
 
@@ -245,7 +354,7 @@ def generate(
     "--purpose",
     "-p",
     required=True,
-    type=click.Choice(["pledge", "rewards"]),
+    type=PURPOSE_CHOICE,
     help="Wallet purpose: pledge or rewards",
 )
 @click.option(
@@ -263,28 +372,47 @@ def export(ticker: str, purpose: str, password: str):
     Examples:
         cspocli export --ticker MYPOOL --purpose pledge --password mypassword
     """
+    init_color()
     try:
         from cardano_spo_cli.tools.export import WalletExporter
 
         exporter = WalletExporter(ticker)
         zip_path = exporter.create_encrypted_zip(purpose, password)
 
-        click.echo(f"{Fore.GREEN}✅ Export created: {zip_path}{Style.RESET_ALL}")
-        click.echo(
-            f"{Fore.YELLOW}📦 Archive contains all wallet files{Style.RESET_ALL}"
-        )
-        click.echo(
-            f"{Fore.CYAN}🔒 Protected with password: {password}{Style.RESET_ALL}"
-        )
+        click.echo(f"{OK} Export created: {zip_path}{RESET}")
+        click.echo(f"{YELLOW}📦 Archive contains all wallet files{RESET}")
+        click.echo(f"{CYAN}🔒 Protected with password: {password}{RESET}")
 
     except Exception as e:
-        click.echo(f"{Fore.RED}❌ Export failed: {e}{Style.RESET_ALL}")
+        click.echo(f"{ERR} Export failed: {e}{RESET}")
+        sys.exit(1)
+
+
+@cli.command("update-tools")
+def update_tools():
+    """
+    Download the Cardano tools again
+
+    Tools whose release the server reports unchanged are kept, unless the
+    local copy was modified since it was downloaded.
+
+    Examples:
+        cspocli update-tools
+    """
+    init_color()
+    try:
+        from cardano_spo_cli.tools.download import download_cardano_tools
+
+        download_cardano_tools(force=True)
+    except click.ClickException as e:
+        click.echo(f"{ERR} Update failed: {e}{RESET}")
         sys.exit(1)
 
 
 @cli.command()
 def version():
     """Display version and build information."""
+    init_color()
     from cardano_spo_cli.version import (
         get_full_version,
         get_git_version,
@@ -295,15 +423,20 @@ def version():
     git_version = get_git_version()
     commit_hash = get_git_commit_hash()
 
-    click.echo(f"{Fore.CYAN}Cardano SPO CLI{Style.RESET_ALL}")
-    click.echo(f"Version: {Fore.GREEN}{version_info}{Style.RESET_ALL}")
-    click.echo(f"Git Tag: {Fore.YELLOW}{git_version}{Style.RESET_ALL}")
-    click.echo(f"Commit: {Fore.BLUE}{commit_hash}{Style.RESET_ALL}")
+    click.echo(f"{CYAN}Cardano SPO CLI{RESET}")
+    click.echo(f"Version: {GREEN}{version_info}{RESET}")
+    click.echo(f"Git Tag: {YELLOW}{git_version}{RESET}")
+    click.echo(f"Commit: {BLUE}{commit_hash}{RESET}")
 
 
 def main():
     """Main entry point"""
-    cli()
+    if sys.argv[1:] == ["version"]:
+        # Fast path: bare `version` takes no options, skip Click's parser
+        with click.Context(version, info_name="version", color=USE_COLOR):
+            version.callback()
+        return
+    cli(color=USE_COLOR)
 
 
 if __name__ == "__main__":
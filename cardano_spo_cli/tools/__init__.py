@@ -1 +1,36 @@
 """Cardano SPO CLI tools package."""
+
+import importlib
+
+# Public names and the submodule defining them. Submodules pull in
+# requests, cryptography and mnemonic, so they are imported on first access
+# (PEP 562) instead of when the package is imported.
+_LAZY = {
+    "CardanoWalletGenerator": "wallet",
+    "generate_wallet_real": "wallet",
+    "generate_wallets_real": "wallet",
+    "SimpleCardanoWalletGenerator": "wallet_simple",
+    "generate_wallet_simple": "wallet_simple",
+    "generate_wallets_simple": "wallet_simple",
+    "WalletExporter": "export",
+    "export_wallet_files": "export",
+    "list_wallet_files": "export",
+    "download_cardano_tools": "download",
+    "get_tool_path": "download",
+    "verify_tools": "download",
+}
+
+__all__ = sorted(_LAZY)
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -2,15 +2,22 @@
 Download module for Cardano tools
 """
 
+import functools
+import hashlib
 import os
 import sys
 import platform
 import requests
+import select
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple, Union
 import click
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 
 # URLs for Cardano tools (IntersectMBO GitHub releases)
 # Note: These tools are typically packaged in .tar.gz files, not direct executables
@@ -33,7 +40,30 @@ CARDANO_TOOLS = {
     },
 }
 
+# Large binaries are fetched as RANGE_PARTS parallel byte ranges when the
+# server supports it, smaller files are not worth splitting
+RANGE_PARTS = 4
+RANGE_MIN_SIZE = 8 * 1024 * 1024
 
+# Downloads are read and written 1 MiB at a time through a raw fd
+CHUNK_SIZE = 1024 * 1024
+WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# platform.machine() values of ARM64 hosts, where cardano-cli may crash
+ARM64 = ("arm64", "aarch64")
+
+# Shared session: keep-alive connections to the release hosts are reused
+# across tools and ranges, transient 5xx responses are retried
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_maxsize=RANGE_PARTS * len(CARDANO_TOOLS),
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+
+@functools.lru_cache(maxsize=None)
 def get_system_info() -> Dict[str, str]:
     """Detect operating system and architecture"""
     system = platform.system().lower()
@@ -52,6 +82,13 @@ def get_system_info() -> Dict[str, str]:
     return {"os": os_name, "system": system, "machine": machine}
 
 
+def is_arm64_macos() -> bool:
+    """Whether this is an ARM64 Mac, where cardano-cli is known to crash"""
+    system_info = get_system_info()
+    return system_info["os"] == "darwin" and system_info["machine"] in ARM64
+
+
+@functools.lru_cache(maxsize=None)
 def get_tools_dir() -> Path:
     """Return tools directory"""
     home = Path.home()
@@ -60,31 +97,250 @@ def get_tools_dir() -> Path:
     return tools_dir
 
 
-def download_file(url: str, filepath: Path, description: str) -> None:
-    """Download a file with progress bar"""
+@functools.lru_cache(maxsize=None)
+def get_download_plan() -> Tuple[Tuple[str, Optional[str], str], ...]:
+    """(tool name, URL for this OS, file name) of every tool, built once"""
+    os_name = get_system_info()["os"]
+    extension = ".exe" if os_name == "windows" else ""
+    return tuple(
+        (tool_name, urls.get(os_name), f"{tool_name}{extension}")
+        for tool_name, urls in CARDANO_TOOLS.items()
+    )
+
+
+def open_executable(filepath: Path) -> int:
+    """Open filepath for writing, executable (0755) on Unix whatever the umask"""
+    fd = os.open(filepath, WRITE_FLAGS, 0o755)
+    if get_system_info()["os"] != "windows":
+        os.fchmod(fd, 0o755)
+    return fd
+
+
+def download_range(
+    url: str, fd: int, start: int, end: int, pbar: tqdm
+) -> Optional[str]:
+    """Write bytes start-end of url at the same offset in fd
+
+    Returns the SHA-256 of the range, or None if the server ignored it.
+    """
+    headers = {"Range": f"bytes={start}-{end}"}
+    digest = hashlib.sha256()
+    with SESSION.get(url, headers=headers, stream=True) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            # Range ignored, the caller falls back to a single stream
+            return None
+        offset = start
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            if chunk:
+                digest.update(chunk)
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+                pbar.update(len(chunk))
+    return digest.hexdigest()
+
+
+def download_ranges(
+    url: str, filepath: Path, total_size: int, pbar: tqdm
+) -> Optional[List[Tuple[int, int, str]]]:
+    """Download url as parallel byte ranges
+
+    Returns the (start, end, SHA-256) of each range, or None if ranges are
+    not honored.
+    """
+    part_size = -(-total_size // RANGE_PARTS)
+    bounds = [
+        (start, min(start + part_size, total_size) - 1)
+        for start in range(0, total_size, part_size)
+    ]
+    fd = open_executable(filepath)
+    try:
+        os.ftruncate(fd, total_size)
+        with ThreadPoolExecutor(max_workers=RANGE_PARTS) as executor:
+            futures = [
+                executor.submit(download_range, url, fd, start, end, pbar)
+                for start, end in bounds
+            ]
+            digests = [future.result() for future in futures]
+    finally:
+        os.close(fd)
+    if None in digests:
+        return None
+    return [(start, end, digest) for (start, end), digest in zip(bounds, digests)]
+
+
+def file_matches(filepath: Path, parts: List[Tuple[int, int, str]]) -> bool:
+    """Whether each (start, end) part of filepath still has its SHA-256"""
+    try:
+        with open(filepath, "rb") as f:
+            if os.fstat(f.fileno()).st_size != parts[-1][1] + 1:
+                return False
+            for start, end, sha256 in parts:
+                digest = hashlib.sha256()
+                f.seek(start)
+                remaining = end - start + 1
+                while remaining > 0:
+                    chunk = f.read(min(CHUNK_SIZE, remaining))
+                    if not chunk:
+                        return False
+                    digest.update(chunk)
+                    remaining -= len(chunk)
+                if digest.hexdigest() != sha256:
+                    return False
+    except OSError:
+        return False
+    return True
+
+
+def download_file(
+    url: str, filepath: Path, description: str, position: int = 0
+) -> bool:
+    """Download a file with progress bar (position stacks concurrent bars)
+
+    Returns False if the server reported the local copy as unchanged.
+    """
+    # The .etag sidecar holds the ETag of the local copy, then the SHA-256
+    # of each part as it was downloaded: the server is only asked for a 304
+    # if the file still has those digests
+    etag_file = filepath.with_suffix(".etag")
+    headers = {}
     try:
-        response = requests.get(url, stream=True)
+        etag, *lines = etag_file.read_text().splitlines()
+        parts = [
+            (int(start), int(end), sha256)
+            for start, end, sha256 in (line.split() for line in lines)
+        ]
+    except (OSError, ValueError):
+        parts = []
+    if parts and file_matches(filepath, parts):
+        headers["If-None-Match"] = etag
+
+    try:
+        response = SESSION.get(url, headers=headers, stream=True)
         response.raise_for_status()
+        if response.status_code == 304:
+            response.close()
+            return False
 
         total_size = int(response.headers.get("content-length", 0))
-
-        with open(filepath, "wb") as f:
-            with tqdm(
-                total=total_size, unit="B", unit_scale=True, desc=description
-            ) as pbar:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        pbar.update(len(chunk))
-
-        # Make executable on Unix
-        if platform.system() != "Windows":
-            filepath.chmod(0o755)
+        ranged = (
+            response.headers.get("accept-ranges") == "bytes"
+            and total_size >= RANGE_MIN_SIZE
+            and hasattr(os, "pwrite")
+        )
+
+        with tqdm(
+            total=total_size,
+            unit="B",
+            unit_scale=True,
+            desc=description,
+            position=position,
+            leave=True,
+        ) as pbar:
+            parts = None
+            if ranged:
+                response.close()
+                parts = download_ranges(url, filepath, total_size, pbar)
+                if parts is None:
+                    pbar.reset()
+                    response = SESSION.get(url, stream=True)
+                    response.raise_for_status()
+
+            if parts is None:
+                # Hash the chunks in flight, the file is not read back
+                digest = hashlib.sha256()
+                size = 0
+                fd = open_executable(filepath)
+                try:
+                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                        if chunk:
+                            digest.update(chunk)
+                            os.write(fd, chunk)
+                            size += len(chunk)
+                            pbar.update(len(chunk))
+                finally:
+                    os.close(fd)
+                parts = [(0, size - 1, digest.hexdigest())]
+
+        etag = response.headers.get("ETag")
+        if etag:
+            etag_file.write_text(
+                "".join(
+                    [f"{etag}\n"]
+                    + [f"{start} {end} {sha256}\n" for start, end, sha256 in parts]
+                )
+            )
+        elif etag_file.exists():
+            etag_file.unlink()
+        return True
 
     except requests.RequestException as e:
         raise click.ClickException(f"Error downloading {description}: {e}")
 
 
+def run_version_checks(
+    tool_paths: Dict[str, Path], timeout: float
+) -> Dict[str, Union[subprocess.CompletedProcess, Exception]]:
+    """Run `<tool> --version` for all tools at once and collect the results
+
+    Each result is a CompletedProcess with bytes output, or the exception
+    raised for that tool (subprocess.TimeoutExpired when it did not exit
+    within timeout).
+    """
+    results = {}
+    procs = {}
+    for tool_name, tool_path in tool_paths.items():
+        try:
+            procs[tool_name] = subprocess.Popen(
+                [str(tool_path), "--version"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        except Exception as e:
+            results[tool_name] = e
+
+    deadline = time.monotonic() + timeout
+
+    # On Linux, wait on pidfds so we wake as soon as each child exits instead
+    # of polling. --version output is a few lines and fits in the pipe buffer.
+    pidfds = {}
+    if hasattr(os, "pidfd_open"):
+        try:
+            for proc in procs.values():
+                pidfds[os.pidfd_open(proc.pid)] = proc
+        except OSError:
+            pass  # Kernel without pidfd support, communicate() waits instead
+    try:
+        while pidfds:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            ready, _, _ = select.select(list(pidfds), [], [], remaining)
+            for fd in ready:
+                os.close(fd)
+                del pidfds[fd]
+    finally:
+        for fd in pidfds:
+            os.close(fd)
+
+    for tool_name, proc in procs.items():
+        try:
+            if proc.poll() is None:
+                remaining = max(deadline - time.monotonic(), 0)
+            else:
+                remaining = None  # Exited, only buffered output is left
+            stdout, stderr = proc.communicate(timeout=remaining)
+            results[tool_name] = subprocess.CompletedProcess(
+                proc.args, proc.returncode, stdout, stderr
+            )
+        except Exception as e:
+            proc.kill()
+            proc.wait()
+            results[tool_name] = e
+
+    return results
+
+
 def get_tool_path(tool_name: str) -> Optional[Path]:
     """Return tool path if it exists"""
     tools_dir = get_tools_dir()
@@ -99,26 +355,24 @@ def get_tool_path(tool_name: str) -> Optional[Path]:
 
 
 def download_cardano_tools(force: bool = False) -> Dict[str, Path]:
-    """Download required Cardano tools"""
+    """Download required Cardano tools
+
+    With force, tools already present are fetched again, unless the server
+    reports their release unchanged.
+    """
     system_info = get_system_info()
     tools_dir = get_tools_dir()
     downloaded_tools = {}
+    pending = {}
 
     click.echo("🔧 Downloading Cardano tools...")
 
-    for tool_name, urls in CARDANO_TOOLS.items():
-        url = urls.get(system_info["os"])
+    for tool_name, url, filename in get_download_plan():
         if not url:
             raise click.ClickException(
                 f"URL not available for {tool_name} on {system_info['os']}"
             )
 
-        # Determine filename
-        if system_info["os"] == "windows":
-            filename = f"{tool_name}.exe"
-        else:
-            filename = tool_name
-
         tool_path = tools_dir / filename
 
         # Check if tool already exists
@@ -127,41 +381,54 @@ def download_cardano_tools(force: bool = False) -> Dict[str, Path]:
             downloaded_tools[tool_name] = tool_path
             continue
 
-        # Download tool
         click.echo(f"📥 Downloading {tool_name}...")
-        download_file(url, tool_path, tool_name)
-
-        # Verify tool works (skip for cardano-cli on ARM64 to avoid crashes)
-        try:
-            if tool_name == "cardano-cli" and platform.machine() in [
-                "arm64",
-                "aarch64",
-            ]:
-                click.echo(
-                    f"✅ {tool_name} downloaded (version test skipped on ARM64): {tool_path}"
+        pending[tool_name] = (url, tool_path)
+
+    # Downloads are independent network fetches, run them concurrently
+    if pending:
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = {
+                tool_name: executor.submit(
+                    download_file, url, tool_path, tool_name, position
                 )
-                downloaded_tools[tool_name] = tool_path
-            else:
-                result = subprocess.run(
-                    [str(tool_path), "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
+                for position, (tool_name, (url, tool_path)) in enumerate(
+                    pending.items()
                 )
-                if result.returncode == 0:
-                    click.echo(f"✅ {tool_name} downloaded and functional: {tool_path}")
-                    downloaded_tools[tool_name] = tool_path
-                else:
-                    click.echo(
-                        f"⚠️  {tool_name} downloaded but version issue: {result.stderr}"
-                    )
+            }
+            # Tools the server reported unchanged were checked when fetched
+            for tool_name, future in futures.items():
+                if not future.result():
+                    url, tool_path = pending.pop(tool_name)
+                    click.echo(f"✅ {tool_name} unchanged: {tool_path}")
                     downloaded_tools[tool_name] = tool_path
-        except subprocess.TimeoutExpired:
+
+    # Verify tools work (skip cardano-cli on ARM64 to avoid crashes)
+    checks = run_version_checks(
+        {
+            tool_name: tool_path
+            for tool_name, (url, tool_path) in pending.items()
+            if not (tool_name == "cardano-cli" and system_info["machine"] in ARM64)
+        },
+        timeout=10,
+    )
+
+    for tool_name, (url, tool_path) in pending.items():
+        downloaded_tools[tool_name] = tool_path
+        result = checks.get(tool_name)
+        if result is None:
+            click.echo(
+                f"✅ {tool_name} downloaded (version test skipped on ARM64): {tool_path}"
+            )
+        elif isinstance(result, subprocess.TimeoutExpired):
             click.echo(f"⚠️  {tool_name} downloaded but timeout during test")
-            downloaded_tools[tool_name] = tool_path
-        except Exception as e:
-            click.echo(f"⚠️  {tool_name} downloaded but error during test: {e}")
-            downloaded_tools[tool_name] = tool_path
+        elif isinstance(result, Exception):
+            click.echo(f"⚠️  {tool_name} downloaded but error during test: {result}")
+        elif result.returncode == 0:
+            click.echo(f"✅ {tool_name} downloaded and functional: {tool_path}")
+        else:
+            click.echo(
+                f"⚠️  {tool_name} downloaded but version issue: {result.stderr.decode(errors='replace')}"
+            )
 
     click.echo("✅ All Cardano tools are ready!")
     return downloaded_tools
@@ -172,56 +439,23 @@ def verify_tools() -> Dict[str, Path]:
     tools = {}
     missing_tools = []
 
-    for tool_name in CARDANO_TOOLS.keys():
-        tool_path = get_tool_path(tool_name)
-        if tool_path:
+    tools_dir = get_tools_dir()
+
+    for tool_name, url, filename in get_download_plan():
+        tool_path = tools_dir / filename
+        if tool_path.exists():
             tools[tool_name] = tool_path
         else:
             missing_tools.append(tool_name)
 
-            # Check if we have sufficient tools for real mode (at least cardano-address)
-        if "cardano-address" in tools:
-            # Additional check for ARM64 cardano-cli crash
-            if "cardano-cli" in tools:
-                # Check if we're on ARM64 macOS
-                import platform
-
-                is_arm64_macos = (
-                    platform.system() == "Darwin"
-                    and platform.machine() in ["arm64", "aarch64"]
-                )
-
-                if is_arm64_macos:
-                    # On ARM64 macOS, cardano-cli is known to crash due to Nix dependencies
-                    # But we can still use cardano-address and bech32 for real mode
-                    click.echo(
-                        "ℹ️  cardano-cli may crash on ARM64 macOS (known compatibility issue)"
-                    )
-                    click.echo("✅ Using cardano-address and bech32 for real mode")
-                    # Keep cardano-cli but don't test it
-                else:
-                    # Test cardano-cli on other platforms
-                    try:
-                        result = subprocess.run(
-                            [str(tools["cardano-cli"]), "--version"],
-                            capture_output=True,
-                            text=True,
-                            timeout=5,
-                        )
-                        if result.returncode != 0:
-                            # Remove crashing cardano-cli from tools
-                            del tools["cardano-cli"]
-                            click.echo("⚠️  cardano-cli crashes, using simplified mode")
-                            return {}
-                    except Exception:
-                        # Remove crashing cardano-cli from tools
-                        if "cardano-cli" in tools:
-                            del tools["cardano-cli"]
-                        click.echo("⚠️  cardano-cli crashes, using simplified mode")
-                        return {}
-
-            click.echo("✅ Sufficient tools available for real mode")
-            return tools
+    # Real mode only runs cardano-address, so cardano-cli is not probed here
+    if "cardano-address" in tools:
+        if "cardano-cli" in tools and is_arm64_macos():
+            click.echo(
+                "ℹ️  cardano-cli may crash on ARM64 macOS (known compatibility issue)"
+            )
+        click.echo("✅ Sufficient tools available for real mode")
+        return tools
 
     if missing_tools:
         click.echo(f"❌ Missing tools: {', '.join(missing_tools)}")
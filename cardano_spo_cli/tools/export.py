@@ -2,15 +2,49 @@
 Export functionality for Cardano SPO CLI
 """
 
+import io
 import os
 import zipfile
-import tempfile
 from pathlib import Path
 from typing import List, Optional
 import click
 from cryptography.fernet import Fernet
 from colorama import Fore, Style
 
+# File suffixes listed as available for export
+EXPORT_SUFFIXES = frozenset((".addr", ".skey", ".vkey"))
+
+# Wallet files an export must contain, as {TICKER}-{PURPOSE}.{extension}
+ESSENTIAL_EXTENSIONS = ("base_addr", "reward_addr", "staking_skey", "staking_vkey")
+
+
+def write_file_atomic(path: Path, data: bytes, mode: int = 0o600) -> None:
+    """Write data to path through a synced temp file and os.replace
+
+    A crash leaves either the previous file or the complete new one, never a
+    truncated export or key file.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp_path, flags, mode)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    except OSError:
+        os.close(fd)
+        os.unlink(tmp_path)
+        raise
+    os.close(fd)
+    os.replace(tmp_path, path)
+
+    # Persist the rename itself (directories cannot be opened on Windows)
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
 
 class WalletExporter:
     """Export wallet files securely"""
@@ -18,6 +52,16 @@ class WalletExporter:
     def __init__(self, ticker: str):
         self.ticker = ticker.upper()
         self.home_dir = Path.home() / f".CSPO_{self.ticker}"
+        self._essential_files = {}
+
+    def essential_files(self, purpose: str) -> List[str]:
+        """Names of the files required in an export, built once per purpose"""
+        if purpose not in self._essential_files:
+            self._essential_files[purpose] = [
+                f"{self.ticker}-{purpose}.{extension}"
+                for extension in ESSENTIAL_EXTENSIONS
+            ]
+        return self._essential_files[purpose]
 
     def create_encrypted_zip(self, purpose: str, password: str) -> Path:
         """Create an encrypted ZIP file with wallet files"""
@@ -26,21 +70,12 @@ class WalletExporter:
         if not wallet_dir.exists():
             raise click.ClickException(f"Wallet directory not found: {wallet_dir}")
 
-        # Files to include in export (only essential files)
-        essential_files = [
-            f"{self.ticker}-{purpose}.base_addr",
-            f"{self.ticker}-{purpose}.reward_addr",
-            f"{self.ticker}-{purpose}.staking_skey",
-            f"{self.ticker}-{purpose}.staking_vkey",
-        ]
-
-        # Create temporary ZIP file
-        temp_zip = tempfile.NamedTemporaryFile(suffix=".zip", delete=False)
-        temp_zip.close()
-
-        # Create ZIP file
-        with zipfile.ZipFile(temp_zip.name, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for filename in essential_files:
+        # Build the ZIP in memory, wallet files are a few hundred bytes of
+        # key material that does not compress, so they are stored as is
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zipf:
+            # Files to include in export (only essential files)
+            for filename in self.essential_files(purpose):
                 file_path = wallet_dir / filename
                 if file_path.exists():
                     zipf.write(file_path, filename)
@@ -56,21 +91,15 @@ class WalletExporter:
         key = Fernet.generate_key()
         cipher = Fernet(key)
 
-        with open(temp_zip.name, "rb") as f:
-            encrypted_data = cipher.encrypt(f.read())
+        encrypted_data = cipher.encrypt(buffer.getvalue())
 
         # Create encrypted file
         encrypted_file = wallet_dir / f"{self.ticker}-{purpose}-export.zip.enc"
-        with open(encrypted_file, "wb") as f:
-            f.write(encrypted_data)
+        write_file_atomic(encrypted_file, encrypted_data)
 
         # Save the key separately
         key_file = wallet_dir / f"{self.ticker}-{purpose}-export.key"
-        with open(key_file, "wb") as f:
-            f.write(key)
-
-        # Clean up temporary file
-        os.unlink(temp_zip.name)
+        write_file_atomic(key_file, key)
 
         click.echo(
             f"{Fore.GREEN}Encrypted export created: {encrypted_file}{Style.RESET_ALL}"
@@ -84,34 +113,38 @@ class WalletExporter:
         """List files available for export"""
         wallet_dir = self.home_dir / purpose
 
-        if not wallet_dir.exists():
+        # Single scandir pass, file type comes from the directory entry
+        try:
+            with os.scandir(wallet_dir) as entries:
+                return [
+                    Path(entry.path)
+                    for entry in entries
+                    if os.path.splitext(entry.name)[1] in EXPORT_SUFFIXES
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
             return []
 
-        export_files = []
-        for file_path in wallet_dir.iterdir():
-            if file_path.is_file() and file_path.suffix in [".addr", ".skey", ".vkey"]:
-                export_files.append(file_path)
-
-        return export_files
-
     def verify_export_files(self, purpose: str) -> bool:
         """Verify that all required files exist for export"""
-        required_files = [
-            f"{self.ticker}-{purpose}.base_addr",
-            f"{self.ticker}-{purpose}.reward_addr",
-            f"{self.ticker}-{purpose}.staking_skey",
-            f"{self.ticker}-{purpose}.staking_vkey",
-        ]
-
         wallet_dir = self.home_dir / purpose
 
-        for filename in required_files:
-            file_path = wallet_dir / filename
-            if not file_path.exists():
-                click.echo(
-                    f"{Fore.RED}Missing required file: {filename}{Style.RESET_ALL}"
-                )
-                return False
+        # One directory listing instead of a stat per required file
+        try:
+            with os.scandir(wallet_dir) as entries:
+                present = {entry.name for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            present = set()
+
+        missing = [
+            filename
+            for filename in self.essential_files(purpose)
+            if filename not in present
+        ]
+        for filename in missing:
+            click.echo(f"{Fore.RED}Missing required file: {filename}{Style.RESET_ALL}")
+        if missing:
+            return False
 
         click.echo(
             f"{Fore.GREEN}All required files present for export{Style.RESET_ALL}"
@@ -135,4 +168,6 @@ def list_wallet_files(ticker: str, purpose: str) -> List[Path]:
     """List wallet files available for export"""
     exporter = WalletExporter(ticker)
     return exporter.list_export_files(purpose)
+
+
 # Export functionality
@@ -0,0 +1,111 @@
+"""
+In-process Cardano key derivation (CIP-1852, BIP32-Ed25519 Icarus)
+
+Produces the same bech32 keys and addresses as cardano-address without
+spawning it. Requires the optional PyNaCl package for Ed25519 point
+multiplication; NATIVE_AVAILABLE tells whether it is installed.
+"""
+
+import hashlib
+import hmac
+from typing import Tuple
+import bech32
+from mnemonic import Mnemonic
+
+try:
+    from nacl.bindings import crypto_scalarmult_ed25519_base_noclamp
+except ImportError:  # PyNaCl is optional, cardano-address is used instead
+    crypto_scalarmult_ed25519_base_noclamp = None
+
+NATIVE_AVAILABLE = crypto_scalarmult_ed25519_base_noclamp is not None
+
+HARDENED = 0x80000000
+
+# CIP-1852 derivation paths, in cardano-address notation
+PAYMENT_PATH = "1852H/1815H/0H/0/0"
+STAKING_PATH = "1852H/1815H/0H/2/0"
+
+# bech32 prefix of the keys derived at each path (addr_xsk, stake_xvk...)
+KEY_PREFIXES = {PAYMENT_PATH: "addr", STAKING_PATH: "stake"}
+
+_MNEMO = Mnemonic("english")
+
+
+def bech32_encode_bytes(hrp: str, raw: bytes) -> str:
+    """Encode raw bytes as bech32 (no length limit, like cardano-address)"""
+    return bech32.bech32_encode(hrp, bech32.convertbits(raw, 8, 5))
+
+
+def bech32_decode_bytes(text: str) -> Tuple[str, bytes]:
+    """Decode a bech32 key or address into its prefix and raw bytes"""
+    hrp, data = bech32.bech32_decode(text.strip())
+    if hrp is None:
+        raise ValueError("Invalid bech32 string")
+    return hrp, bytes(bech32.convertbits(data, 5, 8, False))
+
+
+def root_key_from_mnemonic(mnemonic: str) -> bytes:
+    """Icarus master key (kL || kR || chain code) of a recovery phrase"""
+    entropy = bytes(_MNEMO.to_entropy(mnemonic))
+    key = bytearray(hashlib.pbkdf2_hmac("sha512", b"", entropy, 4096, 96))
+    key[0] &= 0b11111000
+    key[31] &= 0b00011111
+    key[31] |= 0b01000000
+    return bytes(key)
+
+
+def public_key(xprv: bytes) -> bytes:
+    """Ed25519 public key of an extended private key"""
+    return crypto_scalarmult_ed25519_base_noclamp(xprv[:32])
+
+
+def derive_child_key(xprv: bytes, index: int) -> bytes:
+    """BIP32-Ed25519 child private key at index (hardened if >= HARDENED)"""
+    kl, kr, chain_code = xprv[:32], xprv[32:64], xprv[64:]
+    index_bytes = index.to_bytes(4, "little")
+    if index >= HARDENED:
+        data = kl + kr + index_bytes
+        z = hmac.new(chain_code, b"\x00" + data, hashlib.sha512).digest()
+        c = hmac.new(chain_code, b"\x01" + data, hashlib.sha512).digest()
+    else:
+        data = public_key(xprv) + index_bytes
+        z = hmac.new(chain_code, b"\x02" + data, hashlib.sha512).digest()
+        c = hmac.new(chain_code, b"\x03" + data, hashlib.sha512).digest()
+
+    child_kl = int.from_bytes(z[:28], "little") * 8 + int.from_bytes(kl, "little")
+    child_kr = (int.from_bytes(z[32:], "little") + int.from_bytes(kr, "little")) % (
+        1 << 256
+    )
+    return child_kl.to_bytes(32, "little") + child_kr.to_bytes(32, "little") + c[32:]
+
+
+def derive_key_path(xprv: bytes, path: str) -> bytes:
+    """Derive along a cardano-address style path such as 1852H/1815H/0H/0/0"""
+    for step in path.split("/"):
+        if step.endswith("H"):
+            xprv = derive_child_key(xprv, HARDENED + int(step[:-1]))
+        else:
+            xprv = derive_child_key(xprv, int(step))
+    return xprv
+
+
+def extended_public_key(xprv: bytes) -> bytes:
+    """Public key with chain code, as `cardano-address key public --with-chain-code`"""
+    return public_key(xprv) + xprv[64:]
+
+
+def key_hash(xvk: bytes) -> bytes:
+    """Blake2b-224 hash of the public key part of an extended public key"""
+    return hashlib.blake2b(xvk[:32], digest_size=28).digest()
+
+
+def enterprise_address(payment_xvk: bytes, network_tag: int) -> str:
+    """Payment address of a key, as `cardano-address address payment`"""
+    hrp = "addr" if network_tag == 1 else "addr_test"
+    return bech32_encode_bytes(hrp, bytes([0x60 | network_tag]) + key_hash(payment_xvk))
+
+
+def stake_address(staking_xvk: bytes, network_tag: int) -> str:
+    """Reward address of a key, as `cardano-address address stake`"""
+    hrp = "stake" if network_tag == 1 else "stake_test"
+    return bech32_encode_bytes(hrp, bytes([0xE0 | network_tag]) + key_hash(staking_xvk))
@@ -2,34 +2,98 @@
 Wallet generation module for Cardano SPO CLI using real Cardano tools
 """
 
-import os
+import functools
+import hashlib
 import json
-import secrets
+import os
 import subprocess
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import click
 from mnemonic import Mnemonic
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import bech32
 from colorama import Fore, Style
 
+from . import keys
 from .download import verify_tools
+from .wallet_simple import write_file
+
+# Name of the keys derived at each path, used in error messages
+KEY_LABELS = {keys.PAYMENT_PATH: "payment", keys.STAKING_PATH: "staking"}
+
+# cardano-address --network-tag of each network, mainnet when unknown
+NETWORK_TAGS = {"mainnet": "1", "testnet": "0", "preview": "0", "preprod": "0"}
+
+# bech32 prefixes of Cardano payment and reward addresses
+ADDRESS_PREFIXES = frozenset(("addr", "addr_test", "stake", "stake_test"))
+
+# Wallet files as (wallet_data field, file suffix, mode); secrets are created
+# owner-only rather than chmod-ed after being written
+WALLET_FILES = (
+    ("base_addr", ".base_addr", 0o644),
+    ("base_addr_candidate", ".base_addr.candidate", 0o644),
+    ("reward_addr", ".reward_addr", 0o644),
+    ("reward_addr_candidate", ".reward_addr.candidate", 0o644),
+    ("staking_skey", ".staking_skey", 0o600),
+    ("staking_vkey", ".staking_vkey", 0o644),
+    ("mnemonic", ".mnemonic.txt", 0o600),
+)
+
+
+def secret_digest(secret: str) -> bytes:
+    """Short Blake2b digest of a secret, to key caches without holding it"""
+    return hashlib.blake2b(secret.encode(), digest_size=16).digest()
+
+
+# Wallets generated together share their reward address, so results are cached
+@functools.lru_cache(maxsize=512)
+def is_valid_address(address: str) -> bool:
+    """Validate a Cardano address using bech32"""
+    # Check prefix first, the pure-Python bech32 checksum is only
+    # computed for strings that can be Cardano addresses
+    if address[: address.rfind("1")].lower() not in ADDRESS_PREFIXES:
+        return False
+
+    try:
+        # Decode bech32 address
+        hrp, data = bech32.bech32_decode(address)
+        return hrp is not None and data is not None
+    except Exception:
+        return False
 
 
 class CardanoWalletGenerator:
     """Cardano wallet generator using real Cardano tools"""
 
-    def __init__(self, ticker: str):
+    def __init__(self, ticker: str, use_native: bool = True):
         self.ticker = ticker.upper()
         self.home_dir = Path.home() / f".CSPO_{self.ticker}"
         self.home_dir.mkdir(parents=True, exist_ok=True)
-        self.tools = verify_tools()
         self.mnemo = Mnemonic("english")
 
         # Check if shared mnemonic already exists for this ticker
         self.shared_mnemonic_file = self.home_dir / f"{self.ticker}-shared.mnemonic.txt"
+        # Loaded or created once, then reused by every wallet
+        self.shared_mnemonic: Optional[str] = None
+
+        # Which wallets were generated from which recovery phrase, so an
+        # unchanged wallet is reused instead of derived again
+        self.manifest_file = self.home_dir / "manifest.json"
+
+        # Root keys by mnemonic digest and (private, public) key pairs by
+        # (root key digest, derivation path), so each is derived once per run
+        self.root_key_cache: Dict[bytes, str] = {}
+        self.key_cache: Dict[Tuple[bytes, str], Tuple[str, str]] = {}
+
+        # Derive keys in-process when PyNaCl is installed, cardano-address
+        # is then not needed at all
+        self.native = use_native and keys.NATIVE_AVAILABLE
+        if self.native:
+            self.tools = {}
+            click.echo("✅ Using in-process Cardano key derivation")
+            return
+
+        self.tools = verify_tools()
 
         # Check if tools are available
         if not self.tools:
@@ -37,42 +101,6 @@ class CardanoWalletGenerator:
                 "Real Cardano tools not available. Use --simple flag for simplified mode."
             )
 
-        # Check if cardano-cli is usable (not crashing)
-        if "cardano-cli" in self.tools:
-            import platform
-
-            is_arm64_macos = platform.system() == "Darwin" and platform.machine() in [
-                "arm64",
-                "aarch64",
-            ]
-
-            if is_arm64_macos:
-                # On ARM64 macOS, cardano-cli is known to crash due to Nix dependencies
-                # But we can still use cardano-address and bech32 for real mode
-                click.echo(
-                    "ℹ️  cardano-cli may crash on ARM64 macOS (known compatibility issue)"
-                )
-                click.echo("✅ Using cardano-address and bech32 for real mode")
-                # Keep cardano-cli but don't test it
-            else:
-                # Test cardano-cli on other platforms
-                try:
-                    result = subprocess.run(
-                        [str(self.tools["cardano-cli"]), "--version"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                    )
-                    if result.returncode != 0:
-                        # Remove crashing cardano-cli from tools
-                        del self.tools["cardano-cli"]
-                        click.echo("⚠️  cardano-cli crashes, using simplified mode")
-                except Exception:
-                    # Remove crashing cardano-cli from tools
-                    if "cardano-cli" in self.tools:
-                        del self.tools["cardano-cli"]
-                    click.echo("⚠️  cardano-cli crashes, using simplified mode")
-
         # Check if we have enough tools for real mode
         # We need at least cardano-address for real mode, cardano-cli is optional
         if "cardano-address" in self.tools:
@@ -82,19 +110,22 @@ class CardanoWalletGenerator:
 
     def get_or_create_shared_mnemonic(self) -> str:
         """Get existing shared mnemonic or create new one"""
+        if self.shared_mnemonic is not None:
+            return self.shared_mnemonic
+
         if self.shared_mnemonic_file.exists():
             # Load existing shared mnemonic
             mnemonic = self.shared_mnemonic_file.read_text().strip()
             click.echo(f"📋 Using existing shared mnemonic for {self.ticker}")
-            return mnemonic
         else:
             # Create new shared mnemonic
             mnemonic = self.mnemo.generate(strength=256)
-            # Save shared mnemonic with secure permissions
-            self.shared_mnemonic_file.write_text(mnemonic)
-            self.shared_mnemonic_file.chmod(0o600)  # Secure permissions
+            # Save shared mnemonic, created owner-only (secure permissions)
+            write_file(self.shared_mnemonic_file, mnemonic, 0o600, exclusive=True)
             click.echo(f"🔐 Created new shared mnemonic for {self.ticker}")
-            return mnemonic
+
+        self.shared_mnemonic = mnemonic
+        return mnemonic
 
     def generate_mnemonic(self) -> str:
         """Generate a 24-word recovery phrase (legacy method)"""
@@ -102,231 +133,326 @@ class CardanoWalletGenerator:
 
     def mnemonic_to_root_key(self, mnemonic: str) -> str:
         """Convert mnemonic phrase to root key using cardano-address"""
-        cmd = [
-            str(self.tools["cardano-address"]),
-            "key",
-            "from-recovery-phrase",
-            "Shelley",
-        ]
-        result = subprocess.run(cmd, input=mnemonic, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise click.ClickException(f"Error generating root key: {result.stderr}")
-        return result.stdout.strip()
+        mnemonic_id = secret_digest(mnemonic)
+        if mnemonic_id in self.root_key_cache:
+            return self.root_key_cache[mnemonic_id]
+
+        if self.native:
+            try:
+                root_key = keys.root_key_from_mnemonic(mnemonic)
+            except (ValueError, LookupError) as e:
+                raise click.ClickException(f"Error generating root key: {e}")
+            root_key = keys.bech32_encode_bytes("root_xsk", root_key)
+            self.root_key_cache[mnemonic_id] = root_key
+            return root_key
+
+        (root_key,) = self.run_cardano_address(
+            [
+                (
+                    ["key", "from-recovery-phrase", "Shelley"],
+                    mnemonic,
+                    "generating root key",
+                )
+            ]
+        )
+        self.root_key_cache[mnemonic_id] = root_key
+        return root_key
 
     def derive_payment_key(self, root_key: str, purpose: str) -> Tuple[str, str]:
         """Derive payment keys using cardano-address"""
-        # Payment private key
-        cmd = [str(self.tools["cardano-address"]), "key", "child", "1852H/1815H/0H/0/0"]
-        result = subprocess.run(cmd, input=root_key, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise click.ClickException(f"Error deriving payment key: {result.stderr}")
-        payment_skey = result.stdout.strip()
-
-        # Payment public key
-        cmd = [str(self.tools["cardano-address"]), "key", "public", "--with-chain-code"]
-        result = subprocess.run(cmd, input=payment_skey, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise click.ClickException(f"Error generating public key: {result.stderr}")
-        payment_vkey = result.stdout.strip()
-
-        return payment_skey, payment_vkey
+        return self.derive_key_pairs(root_key, [keys.PAYMENT_PATH])[keys.PAYMENT_PATH]
 
     def derive_staking_key(self, root_key: str) -> Tuple[str, str]:
         """Derive staking keys using cardano-address"""
-        # Staking private key
-        cmd = [str(self.tools["cardano-address"]), "key", "child", "1852H/1815H/0H/2/0"]
-        result = subprocess.run(cmd, input=root_key, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise click.ClickException(f"Error deriving staking key: {result.stderr}")
-        staking_skey = result.stdout.strip()
-
-        # Staking public key
-        cmd = [str(self.tools["cardano-address"]), "key", "public", "--with-chain-code"]
-        result = subprocess.run(cmd, input=staking_skey, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise click.ClickException(
-                f"Error generating staking public key: {result.stderr}"
+        return self.derive_key_pairs(root_key, [keys.STAKING_PATH])[keys.STAKING_PATH]
+
+    def derive_key_pairs(
+        self, root_key: str, paths: List[str]
+    ) -> Dict[str, Tuple[str, str]]:
+        """Derive the (private, public) key pairs at several paths
+
+        With cardano-address, the child keys of all paths are derived side by
+        side, then their public keys. Pairs are cached per (root key digest, path).
+        """
+        root_id = secret_digest(root_key)
+        pending = [path for path in paths if (root_id, path) not in self.key_cache]
+
+        if self.native and pending:
+            _, root = keys.bech32_decode_bytes(root_key)
+            for path in pending:
+                xprv = keys.derive_key_path(root, path)
+                prefix = keys.KEY_PREFIXES[path]
+                self.key_cache[(root_id, path)] = (
+                    keys.bech32_encode_bytes(f"{prefix}_xsk", xprv),
+                    keys.bech32_encode_bytes(
+                        f"{prefix}_xvk", keys.extended_public_key(xprv)
+                    ),
+                )
+        elif pending:
+            skeys = self.run_cardano_address(
+                [
+                    (
+                        ["key", "child", path],
+                        root_key,
+                        f"deriving {KEY_LABELS[path]} key",
+                    )
+                    for path in pending
+                ]
             )
-        staking_vkey = result.stdout.strip()
-
-        return staking_skey, staking_vkey
+            vkeys = self.run_cardano_address(
+                [
+                    (
+                        ["key", "public", "--with-chain-code"],
+                        skey,
+                        f"generating {KEY_LABELS[path]} public key",
+                    )
+                    for path, skey in zip(pending, skeys)
+                ]
+            )
+            for path, skey, vkey in zip(pending, skeys, vkeys):
+                self.key_cache[(root_id, path)] = (skey, vkey)
+
+        return {path: self.key_cache[(root_id, path)] for path in paths}
+
+    def run_cardano_address(self, jobs: List[Tuple[List[str], str, str]]) -> List[str]:
+        """Run cardano-address once per (args, stdin, action) job, side by side
+
+        Returns the stripped outputs in job order; the first failing job
+        raises with its action in the message. Keys and addresses are ASCII,
+        so pipes are read as bytes and decoded once.
+        """
+        binary = str(self.tools["cardano-address"])
+        processes = [
+            subprocess.Popen(
+                [binary, *args],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            for args, _, _ in jobs
+        ]
+        results = [
+            process.communicate(stdin.encode())
+            for process, (_, stdin, _) in zip(processes, jobs)
+        ]
+        for process, (stdout, stderr), (_, _, action) in zip(processes, results, jobs):
+            if process.returncode != 0:
+                raise click.ClickException(
+                    f"Error {action}: {stderr.decode(errors='replace')}"
+                )
+        return [stdout.decode("ascii").strip() for stdout, _ in results]
 
     def generate_payment_address(
         self, payment_vkey: str, staking_vkey: str, network: str = "mainnet"
     ) -> str:
         """Generate payment address using cardano-address"""
-        # Map network to network tag
-        network_tags = {"mainnet": "1", "testnet": "0", "preview": "0", "preprod": "0"}
-        network_tag = network_tags.get(network, "1")
+        network_tag = NETWORK_TAGS.get(network, "1")
+
+        if self.native:
+            _, xvk = keys.bech32_decode_bytes(payment_vkey)
+            return keys.enterprise_address(xvk, int(network_tag))
 
         # Payment address (base address without staking)
-        cmd = [
-            str(self.tools["cardano-address"]),
-            "address",
-            "payment",
-            "--network-tag",
-            network_tag,
-        ]
-        result = subprocess.run(cmd, input=payment_vkey, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise click.ClickException(
-                f"Error generating payment address: {result.stderr}"
-            )
-        return result.stdout.strip()
+        (payment_addr,) = self.run_cardano_address(
+            [
+                (
+                    ["address", "payment", "--network-tag", network_tag],
+                    payment_vkey,
+                    "generating payment address",
+                )
+            ]
+        )
+        return payment_addr
 
     def generate_staking_address(
         self, staking_vkey: str, network: str = "mainnet"
     ) -> str:
         """Generate staking address using cardano-address"""
-        # Map network to network tag
-        network_tags = {"mainnet": "1", "testnet": "0", "preview": "0", "preprod": "0"}
-        network_tag = network_tags.get(network, "1")
-
-        cmd = [
-            str(self.tools["cardano-address"]),
-            "address",
-            "stake",
-            "--network-tag",
-            network_tag,
-        ]
-        result = subprocess.run(cmd, input=staking_vkey, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise click.ClickException(
-                f"Error generating staking address: {result.stderr}"
+        network_tag = NETWORK_TAGS.get(network, "1")
+
+        if self.native:
+            _, xvk = keys.bech32_decode_bytes(staking_vkey)
+            return keys.stake_address(xvk, int(network_tag))
+
+        (stake_addr,) = self.run_cardano_address(
+            [
+                (
+                    ["address", "stake", "--network-tag", network_tag],
+                    staking_vkey,
+                    "generating staking address",
+                )
+            ]
+        )
+        return stake_addr
+
+    def generate_addresses(
+        self, payment_vkey: str, staking_vkey: str, network: str = "mainnet"
+    ) -> Tuple[str, str]:
+        """Generate the payment and staking addresses of a wallet
+
+        The two cardano-address runs are independent and go out side by side.
+        """
+        if self.native:
+            return (
+                self.generate_payment_address(payment_vkey, staking_vkey, network),
+                self.generate_staking_address(staking_vkey, network),
             )
-        return result.stdout.strip()
+
+        network_tag = NETWORK_TAGS.get(network, "1")
+        payment_addr, stake_addr = self.run_cardano_address(
+            [
+                (
+                    ["address", "payment", "--network-tag", network_tag],
+                    payment_vkey,
+                    "generating payment address",
+                ),
+                (
+                    ["address", "stake", "--network-tag", network_tag],
+                    staking_vkey,
+                    "generating staking address",
+                ),
+            ]
+        )
+        return payment_addr, stake_addr
 
     def validate_address(self, address: str) -> bool:
         """Validate a Cardano address using bech32"""
-        try:
-            # Decode bech32 address
-            hrp, data = bech32.bech32_decode(address)
-            if hrp is None or data is None:
-                return False
-
-            # Check prefix
-            valid_prefixes = ["addr", "addr_test", "stake", "stake_test"]
-            return hrp in valid_prefixes
-        except Exception:
-            return False
-
-    def generate_address_candidate(
-        self, payment_vkey: str, staking_vkey: str, network: str = "mainnet"
-    ) -> str:
-        """Generate a candidate address for verification"""
-        # Generate candidate address using same method
-        return self.generate_payment_address(payment_vkey, staking_vkey, network)
-
-    def verify_address_candidates(self, base_addr: str, candidate_addr: str) -> bool:
-        """Verify that base address matches candidate address"""
-        return base_addr == candidate_addr
+        return is_valid_address(address)
 
-    def save_wallet_files(self, purpose: str, wallet_data: Dict[str, str]) -> Path:
-        """Save wallet files"""
+    def save_wallet_files(
+        self, purpose: str, wallet_data: Dict[str, str]
+    ) -> List[Path]:
+        """Save wallet files and return the paths written"""
         wallet_dir = self.home_dir / purpose
         wallet_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save files
+        prefix = wallet_dir / f"{self.ticker}-{purpose}"
         files_saved = []
+        for field, suffix, mode in WALLET_FILES:
+            file = Path(f"{prefix}{suffix}")
+            write_file(file, wallet_data[field], mode)
+            files_saved.append(file)
 
-        # Base address (payment address)
-        base_addr_file = wallet_dir / f"{self.ticker}-{purpose}.base_addr"
-        with open(base_addr_file, "w") as f:
-            f.write(wallet_data["base_addr"])
-        files_saved.append(base_addr_file)
+        return files_saved
 
-        # Base address candidate for verification
-        base_addr_candidate_file = (
-            wallet_dir / f"{self.ticker}-{purpose}.base_addr.candidate"
-        )
-        with open(base_addr_candidate_file, "w") as f:
-            f.write(wallet_data["base_addr_candidate"])
-        files_saved.append(base_addr_candidate_file)
-
-        # Reward address (staking address)
-        reward_addr_file = wallet_dir / f"{self.ticker}-{purpose}.reward_addr"
-        with open(reward_addr_file, "w") as f:
-            f.write(wallet_data["reward_addr"])
-        files_saved.append(reward_addr_file)
-
-        # Reward address candidate for verification
-        reward_addr_candidate_file = (
-            wallet_dir / f"{self.ticker}-{purpose}.reward_addr.candidate"
+    def read_manifest(self) -> Dict[str, Dict[str, str]]:
+        """Read the manifest of generated wallets, empty if missing or invalid"""
+        try:
+            return json.loads(self.manifest_file.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def manifest_entry(
+        self, network: str, wallet_data: Dict[str, str]
+    ) -> Dict[str, str]:
+        """What the manifest records about a wallet
+
+        Digests of the files written, so a damaged key file is not reused.
+        The recovery phrase copy is compared with the phrase itself instead,
+        as a digest of it would let guesses of the phrase be checked offline.
+        """
+        return {
+            "network": network,
+            "base_addr": wallet_data["base_addr"],
+            "reward_addr": wallet_data["reward_addr"],
+            "files_sha256": {
+                field: hashlib.sha256(wallet_data[field].encode()).hexdigest()
+                for field, _, _ in WALLET_FILES
+                if field != "mnemonic"
+            },
+        }
+
+    def load_wallet(
+        self, purpose: str, network: str, mnemonic: str
+    ) -> Optional[Dict[str, str]]:
+        """Return the saved wallet for purpose if the manifest shows it was
+        generated from mnemonic for network and its files are intact"""
+        entry = self.read_manifest().get(purpose)
+        if entry is None:
+            return None
+
+        prefix = self.home_dir / purpose / f"{self.ticker}-{purpose}"
+        try:
+            wallet_data = {
+                field: Path(f"{prefix}{suffix}").read_text()
+                for field, suffix, _ in WALLET_FILES
+            }
+        except OSError:
+            return None
+        if wallet_data["mnemonic"] != mnemonic:
+            return None
+        if entry != self.manifest_entry(network, wallet_data):
+            return None
+
+        wallet_data["files"] = [f"{prefix}{suffix}" for _, suffix, _ in WALLET_FILES]
+        click.echo(
+            f"{Fore.GREEN}{self.ticker}-{purpose} wallet unchanged, reusing: {prefix.parent}{Style.RESET_ALL}"
         )
-        with open(reward_addr_candidate_file, "w") as f:
-            f.write(wallet_data["reward_addr_candidate"])
-        files_saved.append(reward_addr_candidate_file)
-
-        # Staking private key
-        staking_skey_file = wallet_dir / f"{self.ticker}-{purpose}.staking_skey"
-        with open(staking_skey_file, "w") as f:
-            f.write(wallet_data["staking_skey"])
-        files_saved.append(staking_skey_file)
-
-        # Staking public key
-        staking_vkey_file = wallet_dir / f"{self.ticker}-{purpose}.staking_vkey"
-        with open(staking_vkey_file, "w") as f:
-            f.write(wallet_data["staking_vkey"])
-        files_saved.append(staking_vkey_file)
-
-        # Recovery phrase
-        mnemonic_file = wallet_dir / f"{self.ticker}-{purpose}.mnemonic.txt"
-        with open(mnemonic_file, "w") as f:
-            f.write(wallet_data["mnemonic"])
-        files_saved.append(mnemonic_file)
-
-        # Make sensitive files more secure
-        for file in [staking_skey_file, mnemonic_file]:
-            file.chmod(0o600)  # Read/write for owner only
-
-        return wallet_dir
-
-    def generate_wallet(self, purpose: str, network: str = "mainnet") -> Dict[str, str]:
-        """Generate a complete wallet using real Cardano tools"""
+        return wallet_data
+
+    def record_wallet(self, purpose: str, network: str, wallet_data: Dict[str, str]):
+        """Add a generated wallet to the manifest, replacing it atomically"""
+        manifest = self.read_manifest()
+        manifest[purpose] = self.manifest_entry(network, wallet_data)
+        # Owner-only like the key files it describes
+        tmp_file = self.manifest_file.with_suffix(".tmp")
+        write_file(tmp_file, json.dumps(manifest, indent=2), 0o600)
+        os.replace(tmp_file, self.manifest_file)
+
+    def generate_wallet(
+        self,
+        purpose: str,
+        network: str = "mainnet",
+        mnemonic: Optional[str] = None,
+        root_key: Optional[str] = None,
+        force: bool = False,
+    ) -> Dict[str, str]:
+        """Generate a complete wallet using real Cardano tools
+
+        mnemonic and root_key may be passed in when several wallets are
+        generated from the same shared recovery phrase; a caller passing
+        root_key has already checked that the wallet must be generated. With
+        force, an already generated wallet is derived and written again.
+        """
         click.echo(
             f"{Fore.CYAN}Generating {self.ticker}-{purpose} wallet using real Cardano tools...{Style.RESET_ALL}"
         )
 
         # Get or create shared mnemonic phrase
-        mnemonic = self.get_or_create_shared_mnemonic()
-        click.echo(f"{Fore.GREEN}Recovery phrase ready{Style.RESET_ALL}")
+        if mnemonic is None:
+            mnemonic = self.get_or_create_shared_mnemonic()
+            click.echo(f"{Fore.GREEN}Recovery phrase ready{Style.RESET_ALL}")
+
+        # Nothing to derive if this wallet was already generated
+        if not force and root_key is None:
+            wallet_data = self.load_wallet(purpose, network, mnemonic)
+            if wallet_data is not None:
+                return wallet_data
 
         # Convert to root key
-        root_key = self.mnemonic_to_root_key(mnemonic)
-        click.echo(f"{Fore.GREEN}Root key derived{Style.RESET_ALL}")
+        if root_key is None:
+            root_key = self.mnemonic_to_root_key(mnemonic)
+            click.echo(f"{Fore.GREEN}Root key derived{Style.RESET_ALL}")
 
-        # Derive payment keys
-        payment_skey, payment_vkey = self.derive_payment_key(root_key, purpose)
+        # Derive payment and staking keys in one batch
+        key_pairs = self.derive_key_pairs(
+            root_key, [keys.PAYMENT_PATH, keys.STAKING_PATH]
+        )
+        payment_skey, payment_vkey = key_pairs[keys.PAYMENT_PATH]
         click.echo(f"{Fore.GREEN}Payment keys derived{Style.RESET_ALL}")
-
-        # Derive staking keys
-        staking_skey, staking_vkey = self.derive_staking_key(root_key)
+        staking_skey, staking_vkey = key_pairs[keys.STAKING_PATH]
         click.echo(f"{Fore.GREEN}Staking keys derived{Style.RESET_ALL}")
 
         # Generate addresses
-        base_addr = self.generate_payment_address(payment_vkey, staking_vkey, network)
-        reward_addr = self.generate_staking_address(staking_vkey, network)
-        click.echo(f"{Fore.GREEN}Addresses generated{Style.RESET_ALL}")
-
-        # Generate candidate addresses for verification
-        base_addr_candidate = self.generate_address_candidate(
+        base_addr, reward_addr = self.generate_addresses(
             payment_vkey, staking_vkey, network
         )
-        reward_addr_candidate = self.generate_staking_address(staking_vkey, network)
-        click.echo(
-            f"{Fore.GREEN}Address candidates generated for verification{Style.RESET_ALL}"
-        )
+        click.echo(f"{Fore.GREEN}Addresses generated{Style.RESET_ALL}")
 
-        # Verify address candidates
-        if not self.verify_address_candidates(base_addr, base_addr_candidate):
-            raise click.ClickException(
-                "Address verification failed: base address mismatch"
-            )
-        if not self.verify_address_candidates(reward_addr, reward_addr_candidate):
-            raise click.ClickException(
-                "Address verification failed: reward address mismatch"
-            )
-        click.echo(f"{Fore.GREEN}Address verification successful{Style.RESET_ALL}")
+        # Address generation is deterministic, the candidate files get
+        # the same addresses
+        base_addr_candidate = base_addr
+        reward_addr_candidate = reward_addr
 
         # Validate addresses
         if not self.validate_address(base_addr):
@@ -346,12 +472,44 @@ class CardanoWalletGenerator:
         }
 
         # Save files
-        wallet_dir = self.save_wallet_files(purpose, wallet_data)
+        files_saved = self.save_wallet_files(purpose, wallet_data)
+        wallet_data["files"] = [str(f) for f in files_saved]
+        self.record_wallet(purpose, network, wallet_data)
 
+        wallet_dir = self.home_dir / purpose
         click.echo(f"{Fore.GREEN}Wallet generated in: {wallet_dir}{Style.RESET_ALL}")
 
         return wallet_data
 
+    def generate_wallets(
+        self, purposes: List[str], network: str = "mainnet", force: bool = False
+    ) -> Dict[str, Dict[str, str]]:
+        """Generate wallets for several purposes from a single root key,
+        regenerating the ones already saved if force is set"""
+        mnemonic = self.get_or_create_shared_mnemonic()
+        click.echo(f"{Fore.GREEN}Recovery phrase ready{Style.RESET_ALL}")
+
+        wallets = {
+            purpose: None if force else self.load_wallet(purpose, network, mnemonic)
+            for purpose in purposes
+        }
+        pending = [purpose for purpose, wallet in wallets.items() if wallet is None]
+        if not pending:
+            return wallets
+
+        root_key = self.mnemonic_to_root_key(mnemonic)
+        click.echo(f"{Fore.GREEN}Root key derived{Style.RESET_ALL}")
+
+        # Both key pairs are derived once here, every wallet then reuses them
+        # from the key cache; wallets are generated in purpose order so their
+        # messages do not interleave
+        self.derive_key_pairs(root_key, [keys.PAYMENT_PATH, keys.STAKING_PATH])
+        for purpose in pending:
+            wallets[purpose] = self.generate_wallet(
+                purpose, network, mnemonic, root_key
+            )
+        return wallets
+
 
 def generate_wallet_real(
     ticker: str, purpose: str, network: str = "mainnet"
@@ -361,6 +519,14 @@ def generate_wallet_real(
     return generator.generate_wallet(purpose, network)
 
 
+def generate_wallets_real(
+    ticker: str, purposes: List[str], network: str = "mainnet", force: bool = False
+) -> Dict[str, Dict[str, str]]:
+    """Generate wallets for several purposes using real Cardano tools"""
+    generator = CardanoWalletGenerator(ticker)
+    return generator.generate_wallets(purposes, network, force)
+
+
 # Real wallet
 # Address verification
 # Cross verification
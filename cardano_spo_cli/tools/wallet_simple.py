@@ -4,10 +4,39 @@
 import click
 import hashlib
 import hmac
+import os
 from pathlib import Path
+from typing import List, Optional, Tuple
 from mnemonic import Mnemonic
 from colorama import Fore, Style
 
+# Wallet files as (wallet_data field, file suffix, mode); secrets are created
+# owner-only. The simplified generator writes no candidate addresses
+WALLET_FILES = (
+    ("base_addr", ".base_addr", 0o644),
+    ("reward_addr", ".reward_addr", 0o644),
+    ("staking_skey", ".staking_skey", 0o600),
+    ("staking_vkey", ".staking_vkey", 0o644),
+    ("mnemonic", ".mnemonic.txt", 0o600),
+)
+
+
+def write_file(path: Path, text: str, mode: int, exclusive: bool = False):
+    """Write text to path through a raw fd, created with mode
+
+    exclusive fails if path exists. Otherwise an existing file is truncated,
+    and an owner-only (0600) mode is set on it too, since the open mode
+    only applies to new files.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_EXCL if exclusive else os.O_TRUNC)
+    fd = os.open(path, flags, mode)
+    try:
+        if mode == 0o600 and not exclusive and hasattr(os, "fchmod"):
+            os.fchmod(fd, mode)
+        os.write(fd, text.encode())
+    finally:
+        os.close(fd)
+
 
 class SimpleCardanoWalletGenerator:
     def __init__(self, ticker: str):
@@ -18,22 +47,29 @@ class SimpleCardanoWalletGenerator:
 
         # Check if shared mnemonic already exists for this ticker
         self.shared_mnemonic_file = self.home_dir / f"{self.ticker}-shared.mnemonic.txt"
+        # Loaded or created once, then reused by every wallet
+        self.shared_mnemonic: Optional[str] = None
+        # (seed, HMAC keyed with its master key) of the last key pair generated
+        self.child_key_hmac: Optional[Tuple[bytes, hmac.HMAC]] = None
 
     def get_or_create_shared_mnemonic(self) -> str:
         """Get existing shared mnemonic or create new one"""
+        if self.shared_mnemonic is not None:
+            return self.shared_mnemonic
+
         if self.shared_mnemonic_file.exists():
             # Load existing shared mnemonic
             mnemonic = self.shared_mnemonic_file.read_text().strip()
             click.echo(f"📋 Using existing shared mnemonic for {self.ticker}")
-            return mnemonic
         else:
             # Create new shared mnemonic
             mnemonic = self.mnemo.generate(strength=256)
-            # Save shared mnemonic with secure permissions
-            self.shared_mnemonic_file.write_text(mnemonic)
-            self.shared_mnemonic_file.chmod(0o600)  # Secure permissions
+            # Save shared mnemonic, created owner-only (secure permissions)
+            write_file(self.shared_mnemonic_file, mnemonic, 0o600, exclusive=True)
             click.echo(f"🔐 Created new shared mnemonic for {self.ticker}")
-            return mnemonic
+
+        self.shared_mnemonic = mnemonic
+        return mnemonic
 
     def generate_mnemonic(self) -> str:
         """Generate a 24-word recovery phrase (legacy method)"""
@@ -54,10 +90,30 @@ class SimpleCardanoWalletGenerator:
         path_bytes = path.encode()
         return hmac.new(parent_key, path_bytes, hashlib.sha256).digest()
 
+    def derive_master_key_from_mnemonic(self, mnemonic: str) -> bytes:
+        """Run the seed and master key derivation for a mnemonic"""
+        # Convert to seed
+        seed = self.mnemonic_to_seed(mnemonic)
+        click.echo(f"{Fore.GREEN}Seed derived{Style.RESET_ALL}")
+
+        # Derive master key
+        master_key = self.derive_master_key(seed)
+        click.echo(f"{Fore.GREEN}Master key derived{Style.RESET_ALL}")
+        return master_key
+
     def generate_key_pair(self, seed: bytes, path: str) -> tuple[bytes, bytes]:
         """Generate key pair from seed and path"""
-        master_key = self.derive_master_key(seed)
-        child_key = self.derive_child_key(master_key, path)
+        # Same result as derive_child_key(derive_master_key(seed), path), but
+        # the keyed HMAC is set up once per seed and copied for each path
+        if self.child_key_hmac is None or self.child_key_hmac[0] != seed:
+            master_key = self.derive_master_key(seed)
+            self.child_key_hmac = (
+                seed,
+                hmac.new(master_key, digestmod=hashlib.sha256),
+            )
+        child_hmac = self.child_key_hmac[1].copy()
+        child_hmac.update(path.encode())
+        child_key = child_hmac.digest()
 
         # Simplified key pair generation
         private_key = child_key[:32]
@@ -71,27 +127,33 @@ class SimpleCardanoWalletGenerator:
         prefix = "stake" if is_stake else "addr"
         network = "test" if is_stake else "1"
 
-        # Create a simplified address format
-        key_hash = hashlib.sha256(public_key).hexdigest()[:28]
+        # Create a simplified address format (28 hex digits = first 14 bytes)
+        key_hash = hashlib.sha256(public_key).digest()[:14].hex()
         return f"{prefix}{network}1{key_hash}"
 
-    def generate_wallet(self, purpose: str, network: str = "mainnet"):
-        """Generate a complete wallet (simplified version)"""
+    def generate_wallet(
+        self,
+        purpose: str,
+        network: str = "mainnet",
+        mnemonic: Optional[str] = None,
+        master_key: Optional[bytes] = None,
+    ):
+        """Generate a complete wallet (simplified version)
+
+        mnemonic and master_key may be passed in when several wallets are
+        generated from the same shared recovery phrase.
+        """
         click.echo(
             f"{Fore.CYAN}Generating {self.ticker}-{purpose} wallet (simplified version)...{Style.RESET_ALL}"
         )
 
         # Get or create shared mnemonic phrase
-        mnemonic = self.get_or_create_shared_mnemonic()
-        click.echo(f"{Fore.GREEN}Recovery phrase ready{Style.RESET_ALL}")
-
-        # Convert to seed
-        seed = self.mnemonic_to_seed(mnemonic)
-        click.echo(f"{Fore.GREEN}Seed derived{Style.RESET_ALL}")
+        if mnemonic is None:
+            mnemonic = self.get_or_create_shared_mnemonic()
+            click.echo(f"{Fore.GREEN}Recovery phrase ready{Style.RESET_ALL}")
 
-        # Derive master key
-        master_key = self.derive_master_key(seed)
-        click.echo(f"{Fore.GREEN}Master key derived{Style.RESET_ALL}")
+        if master_key is None:
+            master_key = self.derive_master_key_from_mnemonic(mnemonic)
 
         # Generate payment keys
         payment_skey, payment_vkey = self.generate_key_pair(
@@ -114,51 +176,37 @@ class SimpleCardanoWalletGenerator:
         wallet_dir = self.home_dir / purpose
         wallet_dir.mkdir(parents=True, exist_ok=True)
 
+        # Hex-encode the keys once, for the files and the returned data
+        wallet_data = {
+            "base_addr": base_addr,
+            "reward_addr": reward_addr,
+            "staking_skey": staking_skey.hex(),
+            "staking_vkey": staking_vkey.hex(),
+            "mnemonic": mnemonic,
+        }
+
         # Save files
         files_saved = []
-
-        # Base address
-        base_addr_file = wallet_dir / f"{self.ticker}-{purpose}.base_addr"
-        with open(base_addr_file, "w") as f:
-            f.write(base_addr)
-        files_saved.append(base_addr_file)
-
-        # Reward address
-        reward_addr_file = wallet_dir / f"{self.ticker}-{purpose}.reward_addr"
-        with open(reward_addr_file, "w") as f:
-            f.write(reward_addr)
-        files_saved.append(reward_addr_file)
-
-        # Staking private key
-        staking_skey_file = wallet_dir / f"{self.ticker}-{purpose}.staking_skey"
-        with open(staking_skey_file, "w") as f:
-            f.write(staking_skey.hex())
-        files_saved.append(staking_skey_file)
-
-        # Staking public key
-        staking_vkey_file = wallet_dir / f"{self.ticker}-{purpose}.staking_vkey"
-        with open(staking_vkey_file, "w") as f:
-            f.write(staking_vkey.hex())
-        files_saved.append(staking_vkey_file)
-
-        # Recovery phrase
-        mnemonic_file = wallet_dir / f"{self.ticker}-{purpose}.mnemonic.txt"
-        with open(mnemonic_file, "w") as f:
-            f.write(mnemonic)
-        files_saved.append(mnemonic_file)
-
-        # Make sensitive files more secure
-        for file in [staking_skey_file, mnemonic_file]:
-            file.chmod(0o600)  # Read/write for owner only
+        for field, suffix, mode in WALLET_FILES:
+            file = wallet_dir / f"{self.ticker}-{purpose}{suffix}"
+            write_file(file, wallet_data[field], mode)
+            files_saved.append(file)
 
         click.echo(f"{Fore.GREEN}Wallet generated in: {wallet_dir}{Style.RESET_ALL}")
 
+        wallet_data["files"] = [str(f) for f in files_saved]
+        return wallet_data
+
+    def generate_wallets(self, purposes: List[str], network: str = "mainnet"):
+        """Generate wallets for several purposes from a single seed derivation"""
+        mnemonic = self.get_or_create_shared_mnemonic()
+        click.echo(f"{Fore.GREEN}Recovery phrase ready{Style.RESET_ALL}")
+
+        master_key = self.derive_master_key_from_mnemonic(mnemonic)
+
         return {
-            "base_addr": base_addr,
-            "reward_addr": reward_addr,
-            "staking_skey": staking_skey.hex(),
-            "staking_vkey": staking_vkey.hex(),
-            "mnemonic": mnemonic,
+            purpose: self.generate_wallet(purpose, network, mnemonic, master_key)
+            for purpose in purposes
         }
 
 
@@ -168,6 +216,12 @@ def generate_wallet_simple(ticker: str, purpose: str, network: str = "mainnet"):
     return generator.generate_wallet(purpose, network)
 
 
+def generate_wallets_simple(ticker: str, purposes: List[str], network: str = "mainnet"):
+    """Generate wallets for several purposes (simplified version)"""
+    generator = SimpleCardanoWalletGenerator(ticker)
+    return generator.generate_wallets(purposes, network)
+
+
 # Address generation
 # File management
 # Secure permissions
@@ -15,11 +15,10 @@ def get_git_version() -> str:
         result = subprocess.run(
             ["git", "describe", "--tags", "--abbrev=0"],
             capture_output=True,
-            text=True,
             cwd=Path(__file__).parent.parent,
         )
         if result.returncode == 0:
-            version = result.stdout.strip()
+            version = result.stdout.decode("ascii").strip()
             # Remove 'v' prefix if present
             if version.startswith("v"):
                 version = version[1:]
@@ -36,11 +35,10 @@ def get_git_commit_hash() -> Optional[str]:
         result = subprocess.run(
             ["git", "rev-parse", "--short", "HEAD"],
             capture_output=True,
-            text=True,
             cwd=Path(__file__).parent.parent,
         )
         if result.returncode == 0:
-            return result.stdout.strip()
+            return result.stdout.decode("ascii").strip()
     except Exception:
         pass
 
@@ -82,4 +80,6 @@ def get_version_info() -> dict:
         "is_dirty": is_dirty,
         "full_version": get_full_version(),
     }
+
+
 # Version management
@@ -18,6 +18,10 @@ setup(
         "colorama>=0.4.4",
         "tqdm>=4.62.0",
     ],
+    extras_require={
+        # In-process key derivation instead of the cardano-address binary
+        "native": ["pynacl>=1.4.0"],
+    },
     entry_points={
         "console_scripts": [
             "cspocli=cardano_spo_cli.cli:main",
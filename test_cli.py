@@ -7,6 +7,13 @@ import subprocess
 import json
 import os
 from pathlib import Path
+from cardano_spo_cli.tools import keys
+
+# CIP-3 Icarus test vector recovery phrase
+ICARUS_MNEMONIC = (
+    "eight country switch draw meat scout mystery blade tip drift useless good "
+    "keep usage title"
+)
 
 
 def test_cli_help():
@@ -69,6 +76,44 @@ def test_wallet_generation():
         return False
 
 
+def test_generate_all_purposes():
+    """Test generating pledge and rewards wallets in one run"""
+    print("🧪 Testing --purpose all...")
+    try:
+        result = subprocess.run(
+            [
+                "python3",
+                "-m",
+                "cardano_spo_cli",
+                "generate",
+                "--ticker",
+                "TESTALL",
+                "--purpose",
+                "all",
+                "--simple",
+                "--quiet",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            print(f"❌ Error: {result.stderr}")
+            return False
+
+        # The JSON document is the last line of output
+        data = json.loads(result.stdout.strip().splitlines()[-1])
+        purposes = [wallet["purpose"] for wallet in data]
+        if purposes == ["pledge", "rewards"]:
+            print("✅ Both wallets generated")
+            return True
+        else:
+            print(f"❌ Unexpected purposes: {purposes}")
+            return False
+    except Exception as e:
+        print(f"❌ Exception: {e}")
+        return False
+
+
 def test_wallet_files():
     """Test wallet file verification"""
     print("🧪 Testing wallet file verification...")
@@ -155,6 +200,171 @@ def test_mnemonic():
         return False
 
 
+def test_force_regenerates():
+    """Test that --force rewrites a tampered key file"""
+    print("🧪 Testing --force regeneration...")
+    try:
+        skey_file = Path.home() / ".CSPO_TEST" / "pledge" / "TEST-pledge.staking_skey"
+        if not skey_file.exists():
+            print("❌ Staking key file not found")
+            return False
+
+        original = skey_file.read_text()
+        skey_file.write_text("tampered")
+        result = subprocess.run(
+            [
+                "python3",
+                "-m",
+                "cardano_spo_cli",
+                "generate",
+                "--ticker",
+                "TEST",
+                "--purpose",
+                "pledge",
+                "--force",
+                "--yes",
+                "--quiet",
+                "--no-banner",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            print(f"❌ Error: {result.stderr}")
+            return False
+
+        if skey_file.read_text() == original:
+            print("✅ Tampered key file regenerated")
+            return True
+        else:
+            print("❌ Key file was not regenerated")
+            return False
+    except Exception as e:
+        print(f"❌ Exception: {e}")
+        return False
+
+
+def test_manifest_reuse():
+    """Test that the manifest reuses intact wallets and regenerates others"""
+    print("🧪 Testing wallet reuse through the manifest...")
+    if not keys.NATIVE_AVAILABLE:
+        print("⏭️  PyNaCl not installed, skipped")
+        return True
+
+    try:
+        from cardano_spo_cli.tools.wallet import CardanoWalletGenerator
+
+        generator = CardanoWalletGenerator("TESTREUSE")
+        generator.generate_wallets(["pledge"], force=True)
+        skey_file = generator.home_dir / "pledge" / "TESTREUSE-pledge.staking_skey"
+        original = skey_file.read_text()
+
+        # An intact wallet is reused: its files are not written again
+        os.utime(skey_file, (0, 0))
+        generator.generate_wallets(["pledge"])
+        if skey_file.stat().st_mtime != 0:
+            print("❌ Unchanged wallet was regenerated")
+            return False
+
+        # A tampered key file is regenerated without --force
+        skey_file.write_text("tampered")
+        generator.generate_wallets(["pledge"])
+        if skey_file.read_text() != original:
+            print("❌ Tampered key file was reused")
+            return False
+
+        # force regenerates an intact wallet
+        os.utime(skey_file, (0, 0))
+        generator.generate_wallets(["pledge"], force=True)
+        if skey_file.stat().st_mtime == 0:
+            print("❌ force did not regenerate the wallet")
+            return False
+
+        manifest = generator.manifest_file
+        mnemonic = generator.get_or_create_shared_mnemonic()
+        if manifest.stat().st_mode & 0o077 or mnemonic in manifest.read_text():
+            print("❌ Manifest is readable by others or holds the phrase")
+            return False
+
+        print("✅ Intact wallets reused, tampered ones regenerated")
+        return True
+    except Exception as e:
+        print(f"❌ Exception: {e}")
+        return False
+
+
+def test_native_root_key():
+    """Test the in-process root key against the CIP-3 Icarus vector"""
+    print("🧪 Testing native root key derivation...")
+    if not keys.NATIVE_AVAILABLE:
+        print("⏭️  PyNaCl not installed, skipped")
+        return True
+
+    expected = (
+        "c065afd2832cd8b087c4d9ab7011f481ee1e0721e78ea5dd609f3ab3f156d245"
+        "d176bd8fd4ec60b4731c3918a2a72a0226c0cd119ec35b47e4d55884667f552a"
+        "23f7fdcd4a10c6cd2c7393ac61d877873e248f417634aa3d812af327ffe9d620"
+    )
+    root_key = keys.root_key_from_mnemonic(ICARUS_MNEMONIC).hex()
+    if root_key == expected:
+        print("✅ Root key matches the CIP-3 vector")
+        return True
+    else:
+        print(f"❌ Unexpected root key: {root_key[:16]}...")
+        return False
+
+
+def test_native_keys_and_addresses():
+    """Test in-process keys and addresses against pinned values"""
+    print("🧪 Testing native keys and addresses...")
+    if not keys.NATIVE_AVAILABLE:
+        print("⏭️  PyNaCl not installed, skipped")
+        return True
+
+    root_key = keys.root_key_from_mnemonic(ICARUS_MNEMONIC)
+    payment_xsk = keys.derive_key_path(root_key, keys.PAYMENT_PATH)
+    payment_xvk = keys.extended_public_key(payment_xsk)
+    staking_xvk = keys.extended_public_key(
+        keys.derive_key_path(root_key, keys.STAKING_PATH)
+    )
+
+    expected = {
+        "addr_xsk": (
+            "addr_xsk1qr0nancwq2temk0w26wsjsfvrums73mq2j42rmeu7ksgcp2h6fz6dtg0aqdt"
+            "2h3kz784seku37pu74ernl0wudw8xlhcs7ty4t3q2qpt9hg2nwp3g8mx2rzq40kfa4fwe"
+            "2n22euztjev0g2tj3ftegxqyqhyssj8"
+        ),
+        "addr_xvk": (
+            "addr_xvk1ejvqn9zp2rqq7wgne543q05mgtlxyslux6nkl84cqp5ju2768uhzktws4xur"
+            "zs0kv5xyp2lvnm2jaj4x54ncyh9jc7s5h9zjhjsvqgqpuut0l"
+        ),
+        "mainnet_addr": "addr1vyv7qlaucathxkwkc503ujw0rv9lfj2rkj96feyst2rs9eqmvfvmx",
+        "mainnet_stake": "stake1ux2436tfe25727kul3qtnyr7k72rvw6ep7h59ll53suwhzq05v5j9",
+        "testnet_addr": (
+            "addr_test1vqv7qlaucathxkwkc503ujw0rv9lfj2rkj96feyst2rs9eqqyas5r"
+        ),
+        "testnet_stake": (
+            "stake_test1uz2436tfe25727kul3qtnyr7k72rvw6ep7h59ll53suwhzqg7xkkc"
+        ),
+    }
+    actual = {
+        "addr_xsk": keys.bech32_encode_bytes("addr_xsk", payment_xsk),
+        "addr_xvk": keys.bech32_encode_bytes("addr_xvk", payment_xvk),
+        "mainnet_addr": keys.enterprise_address(payment_xvk, 1),
+        "mainnet_stake": keys.stake_address(staking_xvk, 1),
+        "testnet_addr": keys.enterprise_address(payment_xvk, 0),
+        "testnet_stake": keys.stake_address(staking_xvk, 0),
+    }
+
+    mismatches = [name for name in expected if actual[name] != expected[name]]
+    if mismatches:
+        print(f"❌ Unexpected values: {mismatches}")
+        return False
+    else:
+        print("✅ Keys and addresses match the pinned values")
+        return True
+
+
 def test_version():
     """Test version command"""
     print("🧪 Testing version command...")
@@ -183,9 +393,14 @@ def main():
     tests = [
         test_cli_help,
         test_wallet_generation,
+        test_generate_all_purposes,
         test_wallet_files,
         test_address_format,
         test_mnemonic,
+        test_force_regenerates,
+        test_manifest_reuse,
+        test_native_root_key,
+        test_native_keys_and_addresses,
         test_version,
     ]
 